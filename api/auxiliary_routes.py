@@ -4,7 +4,7 @@ Endpoints auxiliares da API para monitoramento e consultas
 
 from typing import Dict, Any, List, Optional
 from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import asyncio
 from datetime import datetime
 import psutil
@@ -31,9 +31,12 @@ settings = Settings()
 logger = LoggingService(settings.LOG_LEVEL, settings.LOG_FILE)
 supabase_service = SupabaseService(settings, logger)
 
+# Máximo de empresas verificadas simultaneamente na listagem de empresas
+COMPANY_INFO_CONCURRENCY = 10
+
 
 @auxiliary_router.get("/health", response_model=HealthCheckResponse)
-async def health_check() -> JSONResponse:
+async def health_check() -> ORJSONResponse:
     """
     Endpoint de verificação de saúde da API
     
@@ -116,7 +119,7 @@ async def health_check() -> JSONResponse:
             }
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content=response.to_dict()
         )
@@ -134,14 +137,14 @@ async def health_check() -> JSONResponse:
             services={"error": str(e)}
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content=error_response.model_dump(mode='json')
         )
 
 
 @auxiliary_router.get("/api/schemas")
-async def list_schemas() -> JSONResponse:
+async def list_schemas() -> ORJSONResponse:
     """
     Lista todos os schemas disponíveis no diretório de schemas
     
@@ -153,7 +156,7 @@ async def list_schemas() -> JSONResponse:
         schemas_dir = settings.SCHEMAS_DIR
         
         if not os.path.exists(schemas_dir):
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=200,
                 content={
                     "success": True,
@@ -178,7 +181,7 @@ async def list_schemas() -> JSONResponse:
         
         logger.log_info(f"Listados {len(schema_files)} schemas")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -198,14 +201,14 @@ async def list_schemas() -> JSONResponse:
             details={"details": str(e)}
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content=error_response.model_dump(mode='json')
         )
 
 
 @auxiliary_router.get("/api/logs")
-async def list_logs() -> JSONResponse:
+async def list_logs() -> ORJSONResponse:
     """
     Lista arquivos de log disponíveis
     
@@ -217,7 +220,7 @@ async def list_logs() -> JSONResponse:
         logs_dir = settings.LOGS_DIR
         
         if not os.path.exists(logs_dir):
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=200,
                 content={
                     "success": True,
@@ -245,7 +248,7 @@ async def list_logs() -> JSONResponse:
         
         logger.log_info(f"Listados {len(log_files)} arquivos de log")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -265,14 +268,14 @@ async def list_logs() -> JSONResponse:
             details={"details": str(e)}
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content=error_response.model_dump(mode='json')
         )
 
 
 @auxiliary_router.get("/api/logs/{log_filename}")
-async def get_log_content(log_filename: str, lines: int = 100) -> JSONResponse:
+async def get_log_content(log_filename: str, lines: int = 100) -> ORJSONResponse:
     """
     Obtém conteúdo de um arquivo de log específico
     
@@ -289,7 +292,7 @@ async def get_log_content(log_filename: str, lines: int = 100) -> JSONResponse:
         log_path = os.path.join(logs_dir, log_filename)
         
         if not os.path.exists(log_path):
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=404,
                 content={
                     "success": False,
@@ -307,7 +310,7 @@ async def get_log_content(log_filename: str, lines: int = 100) -> JSONResponse:
         
         file_stats = os.stat(log_path)
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -333,14 +336,71 @@ async def get_log_content(log_filename: str, lines: int = 100) -> JSONResponse:
             details={"details": str(e)}
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content=error_response.model_dump(mode='json')
         )
 
 
+async def _build_company_info(empresa_id: str,
+                              configs: Optional[Dict[str, Dict[str, str]]]) -> Dict[str, Any]:
+    """
+    Monta o status de uma empresa para a listagem de empresas
+    
+    Args:
+        empresa_id: ID da empresa
+        configs: Configurações já carregadas em lote, ou None para buscar as da empresa
+    """
+    try:
+        if configs is not None:
+            config = configs.get(empresa_id)
+        else:
+            config = await supabase_service.get_company_config(empresa_id)
+        
+        # Verifica se tem configurações mínimas
+        has_db_config = config and 'DB_URL' in config and 'DB_TOKEN' in config
+        
+        # Tenta conectar para verificar status
+        connection_status = "unknown"
+        table_count = 0
+        
+        if has_db_config:
+            try:
+                client = await supabase_service.get_client_connection(empresa_id)
+                if client:
+                    connection_status = "connected"
+                    # Obtém informações das tabelas
+                    tables_info = await supabase_service.get_table_info(empresa_id)
+                    table_count = len(tables_info) if tables_info else 0
+                else:
+                    connection_status = "connection_failed"
+            except:
+                connection_status = "connection_error"
+        else:
+            connection_status = "not_configured"
+        
+        return {
+            "empresa_id": empresa_id,
+            "has_configuration": has_db_config,
+            "connection_status": connection_status,
+            "table_count": table_count,
+            "config_keys": list(config.keys()) if config else []
+        }
+        
+    except Exception as e:
+        logger.log_error(f"Erro ao processar empresa {empresa_id}: {str(e)}")
+        
+        return {
+            "empresa_id": empresa_id,
+            "has_configuration": False,
+            "connection_status": "error",
+            "table_count": 0,
+            "error": str(e)
+        }
+
+
 @auxiliary_router.get("/api/companies")
-async def list_companies() -> JSONResponse:
+async def list_companies() -> ORJSONResponse:
     """
     Lista todas as empresas cadastradas no sistema
     
@@ -356,7 +416,7 @@ async def list_companies() -> JSONResponse:
         companies = await supabase_service.get_all_companies()
         
         if not companies:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=200,
                 content={
                     "success": True,
@@ -366,60 +426,26 @@ async def list_companies() -> JSONResponse:
                 }
             )
         
-        # Processa informações de cada empresa
-        companies_info = []
+        # Configurações de todas as empresas em uma única consulta
+        try:
+            configs = await supabase_service.get_company_configs(companies)
+        except Exception as e:
+            # Sem o lote, cada empresa busca a própria configuração e uma falha não derruba a listagem
+            logger.log_warning(f"Falha ao buscar configurações em lote, buscando por empresa: {str(e)}")
+            configs = None
         
-        for empresa_id in companies:
-            try:
-                # Obtém configurações da empresa
-                config = await supabase_service.get_company_config(empresa_id)
-                
-                # Verifica se tem configurações mínimas
-                has_db_config = config and 'DB_URL' in config and 'DB_TOKEN' in config
-                
-                # Tenta conectar para verificar status
-                connection_status = "unknown"
-                table_count = 0
-                
-                if has_db_config:
-                    try:
-                        client = await supabase_service.get_client_connection(empresa_id)
-                        if client:
-                            connection_status = "connected"
-                            # Obtém informações das tabelas
-                            tables_info = await supabase_service.get_table_info(empresa_id)
-                            table_count = len(tables_info) if tables_info else 0
-                        else:
-                            connection_status = "connection_failed"
-                    except:
-                        connection_status = "connection_error"
-                else:
-                    connection_status = "not_configured"
-                
-                company_info = {
-                    "empresa_id": empresa_id,
-                    "has_configuration": has_db_config,
-                    "connection_status": connection_status,
-                    "table_count": table_count,
-                    "config_keys": list(config.keys()) if config else []
-                }
-                
-                companies_info.append(company_info)
-                
-            except Exception as e:
-                logger.log_error(f"Erro ao processar empresa {empresa_id}: {str(e)}")
-                
-                companies_info.append({
-                    "empresa_id": empresa_id,
-                    "has_configuration": False,
-                    "connection_status": "error",
-                    "table_count": 0,
-                    "error": str(e)
-                })
+        # Processa informações das empresas em paralelo, com concorrência limitada
+        semaphore = asyncio.Semaphore(COMPANY_INFO_CONCURRENCY)
+        
+        async def build_limited(empresa_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await _build_company_info(empresa_id, configs)
+        
+        companies_info = await asyncio.gather(*(build_limited(empresa_id) for empresa_id in companies))
         
         logger.log_info(f"Listagem concluída: {len(companies_info)} empresas")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -435,14 +461,14 @@ async def list_companies() -> JSONResponse:
         # Usar tratamento de erro específico
         error = ErrorHandler.handle_internal_error(e, "listagem de empresas")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=error.status_code,
             content=error.detail
         )
 
 
 @auxiliary_router.get("/api/companies/{empresa_id}/config")
-async def get_company_config(empresa_id: str) -> JSONResponse:
+async def get_company_config(empresa_id: str) -> ORJSONResponse:
     """
     Obtém configurações de uma empresa específica
     
@@ -477,7 +503,7 @@ async def get_company_config(empresa_id: str) -> JSONResponse:
         
         logger.log_info(f"Configurações obtidas para empresa {empresa_id}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -497,14 +523,14 @@ async def get_company_config(empresa_id: str) -> JSONResponse:
         # Usar tratamento de erro específico
         error = ErrorHandler.handle_internal_error(e, f"obtenção de configurações da empresa {empresa_id}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=error.status_code,
             content=error.detail
         )
 
 
 @auxiliary_router.get("/api/companies/{empresa_id}/tables")
-async def get_company_tables(empresa_id: str) -> JSONResponse:
+async def get_company_tables(empresa_id: str) -> ORJSONResponse:
     """
     Lista tabelas de uma empresa específica
     
@@ -538,7 +564,7 @@ async def get_company_tables(empresa_id: str) -> JSONResponse:
         tables_info = await supabase_service.get_table_info(empresa_id)
         
         if not tables_info:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=200,
                 content={
                     "success": True,
@@ -574,7 +600,7 @@ async def get_company_tables(empresa_id: str) -> JSONResponse:
         
         logger.log_info(f"Listagem de tabelas concluída para empresa {empresa_id}: {len(processed_tables)} tabelas")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -597,7 +623,7 @@ async def get_company_tables(empresa_id: str) -> JSONResponse:
             details=str(e)
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content=error_response.to_dict()
         )
\ No newline at end of file
@@ -4,7 +4,7 @@ Endpoints principais da API para recepção de dados e schemas
 
 from typing import Dict, Any, List, Union, Optional
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import asyncio
 import os
 from datetime import datetime
@@ -17,7 +17,7 @@ from models.response_models import (
     ErrorResponse,
     APIResponse
 )
-from services.supabase_service import SupabaseService
+from services.supabase_service import SupabaseService, quote_identifier
 from services.logging_service import LoggingService
 from config.settings import Settings
 
@@ -32,19 +32,28 @@ supabase_service = SupabaseService(settings, logger)
 
 
 async def validate_empresa_id(empresa_id: str) -> bool:
-    """Valida se empresa_id existe e tem configurações válidas"""
+    """
+    Valida se empresa_id existe e tem configurações válidas
+    
+    Raises:
+        HTTPException: 503 se o banco principal não puder ser consultado
+    """
     try:
         config = await supabase_service.get_company_config(empresa_id)
-        if not config:
-            return False
-        
-        # Verifica se tem as configurações mínimas necessárias
-        required_keys = ['DB_URL', 'DB_TOKEN']
-        return all(key in config for key in required_keys)
-        
     except Exception as e:
+        # Falha temporária não significa empresa inexistente: não responde 404
         logger.log_error(f"Erro ao validar empresa_id {empresa_id}: {str(e)}")
+        raise HTTPException(
+            status_code=503,
+            detail="Não foi possível consultar as configurações da empresa. Tente novamente."
+        )
+    
+    if not config:
         return False
+    
+    # Verifica se tem as configurações mínimas necessárias
+    required_keys = ['DB_URL', 'DB_TOKEN']
+    return all(key in config for key in required_keys)
 
 
 def infer_table_schema_from_data(table_name: str, data: List[Dict[str, Any]], empresa_id: str) -> TableSchema:
@@ -101,7 +110,7 @@ async def receive_data(
     empresa_id: str, 
     payload: DataPayload,
     background_tasks: BackgroundTasks
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Endpoint principal para recepção de dados do integrador MySQL
     
@@ -195,16 +204,14 @@ async def receive_data(
         )
         
         # 5. Retornar resposta de sucesso
-        response = DataInsertResponse(
-            success=True,
+        response = DataInsertResponse.ok(
             message=message,
             records_inserted=records_inserted,
             table_name=payload.table_name,
-            client_id=empresa_id,
-            processing_time_seconds=processing_time
+            client_id=empresa_id
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content=response.to_dict()
         )
@@ -223,7 +230,7 @@ async def receive_data(
             details=str(e) if settings.DEBUG else None
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content=error_response.to_dict()
         )
@@ -248,7 +255,7 @@ async def get_data(empresa_id: str, table_name: str):
         )
 
     try:
-        query = f'SELECT * FROM "{table_name}"'
+        query = f'SELECT * FROM {quote_identifier(table_name)}'
         data = await supabase_service.execute_query(empresa_id, query)
 
         if data is None:
@@ -257,7 +264,7 @@ async def get_data(empresa_id: str, table_name: str):
                 detail=f"Tabela '{table_name}' não encontrada para a empresa '{empresa_id}'"
             )
 
-        response = JSONResponse(
+        response = ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -361,7 +368,7 @@ async def _process_schema_request(
     empresa_id_path: Optional[str],
     payload_raw: Any,
     background_tasks: BackgroundTasks
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Processa o schema recebido, aceitando empresa_id via rota ou via corpo.
     """
@@ -478,20 +485,19 @@ async def _process_schema_request(
         # Log de sucesso
         logger.log_info(
             f"Schema recebido e salvo para empresa {empresa_id_final}, "
-            f"tabela: {table_name}, arquivo: {os.path.basename(filepath)}"
+            f"tabela: {table_name}, arquivo: {os.path.basename(filepath)} em {processing_time:.2f}s"
         )
 
         # 4. Retornar confirmação
-        response = SchemaCreateResponse(
+        response = SchemaCreateResponse.model_construct(
             success=True,
+            timestamp=datetime.now(),
             message="Schema recebido e salvo com sucesso",
             table_name=table_name,
-            client_id=empresa_id_final,
-            file_path=filepath,
-            processing_time_seconds=processing_time
+            client_id=empresa_id_final
         )
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content=response.to_dict()
         )
@@ -509,7 +515,7 @@ async def _process_schema_request(
             details=str(e) if settings.DEBUG else None
         )
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content=error_response.to_dict()
         )
@@ -520,7 +526,7 @@ async def receive_schema(
     empresa_id: str,
     request: Request,
     background_tasks: BackgroundTasks
-) -> JSONResponse:
+) -> ORJSONResponse:
     payload = await request.json()
     return await _process_schema_request(empresa_id_path=empresa_id, payload_raw=payload, background_tasks=background_tasks)
 
@@ -529,7 +535,7 @@ async def receive_schema(
 async def receive_schema_body(
     request: Request,
     background_tasks: BackgroundTasks
-) -> JSONResponse:
+) -> ORJSONResponse:
     payload = await request.json()
     return await _process_schema_request(empresa_id_path=None, payload_raw=payload, background_tasks=background_tasks)
 
@@ -538,28 +544,28 @@ async def receive_schema_body(
 async def receive_schema_body_slash(
     request: Request,
     background_tasks: BackgroundTasks
-) -> JSONResponse:
+) -> ORJSONResponse:
     payload = await request.json()
     return await _process_schema_request(empresa_id_path=None, payload_raw=payload, background_tasks=background_tasks)
 
 # Suporte explícito a preflight CORS para evitar 405 em clientes
 @webhook_router.options("/schema")
-async def preflight_schema() -> JSONResponse:
-    return JSONResponse(status_code=200, content={"success": True})
+async def preflight_schema() -> ORJSONResponse:
+    return ORJSONResponse(status_code=200, content={"success": True})
 
 @webhook_router.options("/schema/")
-async def preflight_schema_slash() -> JSONResponse:
-    return JSONResponse(status_code=200, content={"success": True})
+async def preflight_schema_slash() -> ORJSONResponse:
+    return ORJSONResponse(status_code=200, content={"success": True})
 
 @webhook_router.options("/schema/{empresa_id}")
-async def preflight_schema_with_id(empresa_id: str) -> JSONResponse:
-    return JSONResponse(status_code=200, content={"success": True, "empresa_id": empresa_id})
+async def preflight_schema_with_id(empresa_id: str) -> ORJSONResponse:
+    return ORJSONResponse(status_code=200, content={"success": True, "empresa_id": empresa_id})
 
 @webhook_router.post("/data", response_model=APIResponse)
 async def receive_integrator_data_body(
     request: Request,
     background_tasks: BackgroundTasks
-) -> JSONResponse:
+) -> ORJSONResponse:
     payload_raw = await request.json()
     return await _process_integrator_data_request(empresa_id_path=None, payload_raw=payload_raw, background_tasks=background_tasks)
 
@@ -567,19 +573,19 @@ async def receive_integrator_data_body(
 async def receive_integrator_data_body_slash(
     request: Request,
     background_tasks: BackgroundTasks
-) -> JSONResponse:
+) -> ORJSONResponse:
     payload_raw = await request.json()
     return await _process_integrator_data_request(empresa_id_path=None, payload_raw=payload_raw, background_tasks=background_tasks)
 
 @webhook_router.options("/data")
-async def preflight_data() -> JSONResponse:
-    return JSONResponse(status_code=200, content={"success": True})
+async def preflight_data() -> ORJSONResponse:
+    return ORJSONResponse(status_code=200, content={"success": True})
 
 @webhook_router.options("/data/")
-async def preflight_data_slash() -> JSONResponse:
-    return JSONResponse(status_code=200, content={"success": True})
+async def preflight_data_slash() -> ORJSONResponse:
+    return ORJSONResponse(status_code=200, content={"success": True})
 
-async def _process_integrator_data_request(empresa_id_path: Optional[str], payload_raw: Dict[str, Any], background_tasks: BackgroundTasks) -> JSONResponse:
+async def _process_integrator_data_request(empresa_id_path: Optional[str], payload_raw: Dict[str, Any], background_tasks: BackgroundTasks) -> ORJSONResponse:
     start_time = datetime.now()
     try:
         empresa_id = payload_raw.get("empresa_id") or empresa_id_path
@@ -660,9 +666,9 @@ async def _process_integrator_data_request(empresa_id_path: Optional[str], paylo
             "processing_time_seconds": processing_time,
             "tables": table_results
         }
-        return JSONResponse(status_code=200, content=content)
+        return ORJSONResponse(status_code=200, content=content)
     except HTTPException:
         raise
     except Exception as e:
         error_response = ErrorResponse(success=False, message="Erro interno do servidor", error_code="INTERNAL_ERROR", details=str(e) if settings.DEBUG else None)
-        return JSONResponse(status_code=500, content=error_response.to_dict())
\ No newline at end of file
+        return ORJSONResponse(status_code=500, content=error_response.to_dict())
\ No newline at end of file
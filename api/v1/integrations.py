@@ -3,7 +3,7 @@ Rotas para integrações e criação de modelos dinâmicos.
 """
 
 from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from models.base_models import TableSchema
 from models.response_models import APIResponse
@@ -33,7 +33,7 @@ async def create_dynamic_model(schema: TableSchema):
         # A execução de DDL (CREATE TABLE) bem-sucedida retorna uma lista vazia ou None em alguns casos.
         # A falha geralmente levanta uma exceção, que será capturada pelo bloco `except`.
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=201,
             content=APIResponse(success=True, message=f"Tabela '{schema.name}' criada com sucesso.").to_dict()
         )
@@ -26,6 +26,16 @@ class Settings(BaseSettings):
     DATABASE_SECRET: Optional[str] = Field(default=None, description="Senha do Postgres (service role) para conexões diretas")
     DATABASE_URL: Optional[str] = Field(default=None, description="URL de conexão direta com o banco de dados PostgreSQL")
     
+    # Configurações do pool de conexões com os bancos dos clientes
+    DB_POOL_MIN_SIZE: int = Field(default=1, description="Conexões mantidas abertas por pool")
+    DB_POOL_MAX_SIZE: int = Field(default=10, description="Máximo de conexões por pool")
+    DB_POOL_MAX_INACTIVE_LIFETIME: float = Field(default=300, description="Segundos até fechar conexão ociosa")
+    DB_POOL_MAX_QUERIES: int = Field(default=50000, description="Queries por conexão antes de reciclá-la")
+    MAX_CONCURRENT_UPSERTS: int = Field(default=8, description="Upserts simultâneos por empresa")
+    
+    # Configurações do Redis (rate limiting compartilhado entre workers)
+    REDIS_URL: Optional[str] = Field(default=None, description="URL do Redis para rate limiting distribuído")
+    
     # Configurações de logs
     LOG_LEVEL: str = Field(default="INFO", description="Nível de log")
     LOG_FILE: str = Field(default="logs/app.log", description="Arquivo de log")
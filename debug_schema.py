@@ -4,9 +4,10 @@ Script de debug para testar o schema MySQL Integrator
 """
 
 import json
-import requests
 import sys
 
+from tests._client import sync_client
+
 # Dados de teste simplificados
 test_schema = {
     "schema": {
@@ -41,28 +42,31 @@ def test_simple_schema():
     """Testa schema simplificado"""
     print("🧪 Testando schema simplificado...")
     
-    url = "http://localhost:8000/webhook/schema/3e1a0646-0b39-4ea4-9f49-bf7c0cf34ac2"
+    path = "/webhook/schema/3e1a0646-0b39-4ea4-9f49-bf7c0cf34ac2"
+    client = sync_client()
     
     try:
-        response = requests.post(url, json=test_schema)
-        print(f"📊 Status Code: {response.status_code}")
+        status, body = client.post(path, json.dumps(test_schema).encode("utf-8"))
+        print(f"📊 Status Code: {status}")
         
-        if response.status_code == 422:
+        if status == 422:
             print(f"❌ Erro de validação:")
-            print(json.dumps(response.json(), indent=2, ensure_ascii=False))
+            print(json.dumps(json.loads(body), indent=2, ensure_ascii=False))
             return False
-        elif response.status_code == 200:
+        elif status == 200:
             print(f"✅ Sucesso!")
-            print(json.dumps(response.json(), indent=2, ensure_ascii=False))
+            print(json.dumps(json.loads(body), indent=2, ensure_ascii=False))
             return True
         else:
-            print(f"⚠️  Status inesperado: {response.status_code}")
-            print(json.dumps(response.json(), indent=2, ensure_ascii=False))
+            print(f"⚠️  Status inesperado: {status}")
+            print(json.dumps(json.loads(body), indent=2, ensure_ascii=False))
             return False
             
     except Exception as e:
         print(f"❌ Erro na requisição: {e}")
         return False
+    finally:
+        client.close()
 
 def test_schema_validation():
     """Testa validação do schema localmente"""
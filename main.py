@@ -4,7 +4,7 @@ Aplicação FastAPI para recepção de dados MySQL e replicação para Supabase
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import uvicorn
 from datetime import datetime
 import os
@@ -12,15 +12,15 @@ import os
 from config.settings import Settings
 from services.logging_service import LoggingService
 from services.security_service import SecurityService
-from api.data_routes import data_router, webhook_router
-from api.auxiliary_routes import auxiliary_router
-from api.v1.integrations import router as integrations_router
+from api.data_routes import data_router, webhook_router, supabase_service as data_supabase_service
+from api.auxiliary_routes import auxiliary_router, supabase_service as auxiliary_supabase_service
+from api.v1.integrations import router as integrations_router, supabase_service as integrations_supabase_service
 
 
 # Configurações globais
 settings = Settings()
 logger = LoggingService(settings.LOG_LEVEL, settings.LOG_FILE)
-security_service = SecurityService(logger)
+security_service = SecurityService(logger, settings.REDIS_URL)
 
 # Inicialização da aplicação FastAPI
 app = FastAPI(
@@ -28,7 +28,8 @@ app = FastAPI(
     description="API para recepção de dados MySQL e replicação automática para bancos Supabase de clientes",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Middleware para logar o corpo da requisição
@@ -52,12 +53,12 @@ async def rate_limit_middleware(request: Request, call_next):
     try:
         # Aplica rate limiting apenas em endpoints de dados
         if request.url.path.startswith("/api/") and request.url.path != "/api/health":
-            security_service.check_rate_limit(request)
+            await security_service.check_rate_limit(request)
         
         response = await call_next(request)
         return response
     except HTTPException as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=e.status_code,
             content={"error": e.detail}
         )
@@ -105,6 +106,18 @@ async def startup_event():
 async def shutdown_event():
     """Evento executado no encerramento da aplicação"""
     logger.log_info("=== ENCERRANDO APLICAÇÃO ===")
+    
+    # Fecha os pools de conexões dos bancos das empresas (e a verificação periódica)
+    for service in (data_supabase_service, auxiliary_supabase_service, integrations_supabase_service):
+        try:
+            await service.close()
+        except Exception as e:
+            logger.log_error(f"Erro ao fechar pools de conexões: {str(e)}")
+    
+    try:
+        await security_service.close()
+    except Exception as e:
+        logger.log_error(f"Erro ao fechar conexão com o Redis: {str(e)}")
 
 
 @app.get("/")
@@ -133,7 +146,7 @@ async def global_exception_handler(request, exc):
     """Handler global para exceções não tratadas"""
     logger.log_error(f"Exceção não tratada: {str(exc)}")
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "success": False,
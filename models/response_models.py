@@ -21,6 +21,19 @@ class DataInsertResponse(APIResponse):
     table_name: str = Field(..., description="Nome da tabela")
     client_id: str = Field(..., description="ID do cliente")
     errors: Optional[List[str]] = Field(default=None, description="Lista de erros, se houver")
+    
+    @classmethod
+    def ok(cls, message: str, records_inserted: int, table_name: str, client_id: str) -> "DataInsertResponse":
+        """Cria resposta de sucesso sem passar pela validação (dados montados internamente)"""
+        return cls.model_construct(
+            success=True,
+            message=message,
+            timestamp=datetime.now(),
+            records_inserted=records_inserted,
+            table_name=table_name,
+            client_id=client_id,
+            errors=None
+        )
 
 class SchemaCreateResponse(APIResponse):
     """Resposta para criação de schema"""
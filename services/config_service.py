@@ -11,6 +11,11 @@ from services.supabase_service import SupabaseService
 from services.logging_service import LoggingService
 
 
+# Campos obrigatórios e prefixos aceitos para a URL do banco
+_REQUIRED_FIELDS = ('empresa_id', 'database_url', 'database_token')
+_PG_PREFIXES = ('postgresql://', 'postgres://')
+
+
 class CompanyConfig(BaseEntity):
     """Modelo para configuração de empresa"""
     empresa_id: str
@@ -145,12 +150,15 @@ class ConfigService:
         """
         Armazena configuração no cache
         
+        O dicionário é armazenado por referência: o chamador não deve
+        modificá-lo depois de armazenado.
+        
         Args:
             empresa_id: ID da empresa
             config: Dados de configuração
         """
         try:
-            self._config_cache[empresa_id] = config.copy()
+            self._config_cache[empresa_id] = config
             self._cache_expiry[empresa_id] = datetime.now() + self._cache_duration
             
             self.logger.debug(f"Configuração da empresa {empresa_id} armazenada no cache")
@@ -195,10 +203,8 @@ class ConfigService:
         Raises:
             HTTPException: Se a configuração for inválida
         """
-        required_fields = ['empresa_id', 'database_url', 'database_token']
-        
-        for field in required_fields:
-            if field not in config_data or not config_data[field]:
+        for field in _REQUIRED_FIELDS:
+            if not config_data.get(field):
                 self.logger.error(f"Campo obrigatório ausente: {field}")
                 raise HTTPException(
                     status_code=400,
@@ -206,7 +212,7 @@ class ConfigService:
                 )
         
         # Validar URL do banco
-        if not config_data['database_url'].startswith(('postgresql://', 'postgres://')):
+        if not config_data['database_url'].startswith(_PG_PREFIXES):
             self.logger.error("URL do banco inválida")
             raise HTTPException(
                 status_code=400,
@@ -137,6 +137,18 @@ class LoggingService:
         logger = logging.getLogger(__name__)
         logger.warning(message)
 
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Verifica se mensagens do nível informado serão registradas
+        
+        Args:
+            level: Nível de log (logging.DEBUG, logging.ERROR, etc.)
+            
+        Returns:
+            True se o nível estiver habilitado
+        """
+        return logging.getLogger(__name__).isEnabledFor(level)
+
     def log_error(self, error: Exception, context: str = "") -> None:
         """
         Registra erros com contexto adicional
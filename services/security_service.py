@@ -12,6 +12,11 @@ from pydantic import BaseModel, validator
 from fastapi import HTTPException, Request
 from services.logging_service import LoggingService
 
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # Redis é opcional: sem ele, o rate limit fica em memória
+    aioredis = None
+
 class RateLimiter:
     """Classe para implementar rate limiting"""
     
@@ -52,6 +57,90 @@ class RateLimiter:
         client_requests.append(now)
         return True
 
+class RedisRateLimiter:
+    """Classe para rate limiting compartilhado entre workers usando Redis"""
+    
+    # Janela deslizante aproximada: incrementa o contador da janela atual
+    # (que expira após duas janelas) e devolve também o da janela anterior
+    INCR_SCRIPT = """
+    local c = redis.call('INCR', KEYS[1])
+    if c == 1 then redis.call('EXPIRE', KEYS[1], ARGV[1]) end
+    local p = tonumber(redis.call('GET', KEYS[2]) or '0')
+    return {c, p}
+    """
+    
+    # Timeouts curtos: o Redis fica no caminho de toda requisição
+    SOCKET_TIMEOUT_SECONDS = 0.25
+    
+    def __init__(self, redis_url: Optional[str] = None, max_requests: int = 100,
+                 window_seconds: int = 60, retry_after_seconds: int = 30):
+        """
+        Inicializa o rate limiter distribuído
+        
+        Args:
+            redis_url: URL do Redis (sem URL, usa apenas o contador em memória)
+            max_requests: Número máximo de requisições por janela
+            window_seconds: Tamanho da janela em segundos
+            retry_after_seconds: Tempo sem consultar o Redis após uma falha
+        """
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self.fallback = RateLimiter(max_requests=max_requests, window_seconds=window_seconds)
+        self.logger = logging.getLogger(__name__)
+        self._circuit_open_until = 0.0
+        self._script = None
+        
+        if redis_url and aioredis is not None:
+            self._redis = aioredis.from_url(
+                redis_url,
+                socket_connect_timeout=self.SOCKET_TIMEOUT_SECONDS,
+                socket_timeout=self.SOCKET_TIMEOUT_SECONDS
+            )
+            self._script = self._redis.register_script(self.INCR_SCRIPT)
+        elif redis_url:
+            self.logger.warning("REDIS_URL definida, mas o pacote redis não está instalado")
+    
+    async def is_allowed(self, client_ip: str) -> bool:
+        """
+        Verifica se o cliente pode fazer uma requisição
+        
+        Usa contadores no Redis com janela deslizante aproximada: a contagem da
+        janela anterior entra com peso proporcional ao trecho ainda coberto pela
+        janela deslizante. Se o Redis estiver indisponível, usa o contador em
+        memória até o circuito ser reaberto.
+        
+        Args:
+            client_ip: IP do cliente
+            
+        Returns:
+            True se permitido, False caso contrário
+        """
+        now = time.time()
+        if self._script is None or now < self._circuit_open_until:
+            return self.fallback.is_allowed(client_ip)
+        
+        bucket, elapsed = divmod(now, self.window_seconds)
+        bucket = int(bucket)
+        try:
+            current, previous = await self._script(
+                keys=[f"rl:{client_ip}:{bucket}", f"rl:{client_ip}:{bucket - 1}"],
+                args=[self.window_seconds * 2]
+            )
+        except Exception as e:
+            self._circuit_open_until = now + self.retry_after_seconds
+            self.logger.warning(f"Redis indisponível para rate limiting, usando contador local: {str(e)}")
+            return self.fallback.is_allowed(client_ip)
+        
+        previous_weight = 1 - elapsed / self.window_seconds
+        return int(previous) * previous_weight + int(current) <= self.max_requests
+    
+    async def close(self) -> None:
+        """Fecha a conexão com o Redis"""
+        if self._script is not None:
+            self._script = None
+            await self._redis.aclose()
+
 class DataValidator:
     """Classe para validação e sanitização de dados"""
     
@@ -183,19 +272,24 @@ class DataValidator:
 class SecurityService:
     """Serviço principal de segurança"""
     
-    def __init__(self, logging_service: LoggingService):
+    def __init__(self, logging_service: LoggingService, redis_url: Optional[str] = None):
         """
         Inicializa o serviço de segurança
         
         Args:
             logging_service: Serviço de logging
+            redis_url: URL do Redis para rate limiting compartilhado (opcional)
         """
         self.logging_service = logging_service
-        self.rate_limiter = RateLimiter(max_requests=100, window_seconds=60)
+        self.rate_limiter = RedisRateLimiter(redis_url, max_requests=100, window_seconds=60)
         self.validator = DataValidator()
         self.logger = logging.getLogger(__name__)
     
-    def check_rate_limit(self, request: Request) -> None:
+    async def close(self) -> None:
+        """Libera os recursos do serviço (conexão com o Redis)"""
+        await self.rate_limiter.close()
+    
+    async def check_rate_limit(self, request: Request) -> None:
         """
         Verifica rate limiting para uma requisição
         
@@ -207,7 +301,7 @@ class SecurityService:
         """
         client_ip = self._get_client_ip(request)
         
-        if not self.rate_limiter.is_allowed(client_ip):
+        if not await self.rate_limiter.is_allowed(client_ip):
             self.logging_service.log_security_event(
                 "RATE_LIMIT_EXCEEDED", 
                 client_ip,
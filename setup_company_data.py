@@ -4,9 +4,9 @@ Script para configurar dados de empresa de teste no Supabase
 Usa as configurações da aplicação para acessar o banco correto
 """
 
-import asyncio
 import sys
 import os
+from itertools import islice
 from pathlib import Path
 
 # Adicionar o diretório raiz ao path
@@ -16,7 +16,10 @@ from config.settings import Settings
 from services.supabase_service import SupabaseService
 from services.logging_service import LoggingService
 
-async def setup_company_data():
+# Linhas por requisição de upsert ao PostgREST
+UPSERT_CHUNK_SIZE = 500
+
+def setup_company_data():
     """Configura dados de empresa de teste no banco"""
     
     # Inicializar serviços
@@ -92,7 +95,18 @@ async def setup_company_data():
                 print(f"  - {item['chave']}: {item['valor'][:50]}...")
         else:
             print("✗ Nenhuma configuração encontrada para esta empresa")
-            print("NOTA: A tabela company_conf é somente leitura. As configurações devem ser inseridas manualmente no banco de dados.")
+            print("Inserindo configurações em lote...")
+            try:
+                # Um único upsert por bloco (array JSON), sem devolver as linhas inseridas
+                rows = iter(company_data)
+                while chunk := list(islice(rows, UPSERT_CHUNK_SIZE)):
+                    main_client.table('company_conf').upsert(
+                        chunk, on_conflict='empresa_id,chave', returning='minimal'
+                    ).execute()
+                print(f"✓ {len(company_data)} configurações inseridas")
+            except Exception as insert_error:
+                print(f"✗ Falha ao inserir configurações: {str(insert_error)}")
+                print("NOTA: Se a tabela company_conf for somente leitura, as configurações devem ser inseridas manualmente no banco de dados.")
             
         print(f"\n✓ Verificação da empresa {empresa_id} concluída!")
         
@@ -104,7 +118,7 @@ async def setup_company_data():
 
 if __name__ == "__main__":
     print("=== Configuração de Dados de Empresa ===")
-    success = asyncio.run(setup_company_data())
+    success = setup_company_data()
     
     if success:
         print("\n✓ Configuração concluída com sucesso!")
@@ -3,53 +3,49 @@ Script para configurar dados de teste para a empresa test_company_001
 Este script simula a configuração de empresa sem depender do Supabase principal
 """
 
-import json
 import os
 from pathlib import Path
 
-def setup_test_company_config():
-    """Configura dados de teste para a empresa test_company_001"""
-    
-    # Criar diretório de configurações de teste se não existir
-    test_config_dir = Path("test_configs")
-    test_config_dir.mkdir(exist_ok=True)
-    
-    # Configuração de teste para test_company_001
-    test_company_config = {
-        "test_company_001": {
-            "DB_URL": "https://test-company.supabase.co",
-            "DB_TOKEN": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.test-token",
-            "COMPANY_NAME": "Empresa de Teste 001",
-            "ACTIVE": "true"
-        }
+import orjson
+
+# Configuração de teste para test_company_001
+TEST_COMPANY_CONFIG = {
+    "test_company_001": {
+        "DB_URL": "https://test-company.supabase.co",
+        "DB_TOKEN": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.test-token",
+        "COMPANY_NAME": "Empresa de Teste 001",
+        "ACTIVE": "true"
     }
-    
-    # Salvar configuração em arquivo JSON
-    config_file = test_config_dir / "company_configs.json"
-    with open(config_file, 'w', encoding='utf-8') as f:
-        json.dump(test_company_config, f, indent=2, ensure_ascii=False)
-    
-    print(f"✅ Configuração de teste salva em: {config_file}")
-    print(f"📋 Empresa configurada: test_company_001")
-    print(f"🔗 DB_URL: {test_company_config['test_company_001']['DB_URL']}")
-    print(f"🔑 DB_TOKEN: {test_company_config['test_company_001']['DB_TOKEN'][:20]}...")
-    
-    return config_file
+}
 
-def create_mock_supabase_service():
-    """Cria um serviço mock para testes"""
-    
-    mock_service_content = '''"""
+# Código-fonte do serviço mock, já codificado em UTF-8 para escrita direta
+MOCK_SRC = '''"""
 Serviço mock do Supabase para testes
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+@lru_cache(maxsize=8)
+def _load_cached(path_str: str, mtime: float) -> dict:
+    """Lê e interpreta o JSON de configurações (mtime na chave invalida o cache quando o arquivo muda)"""
+    return _json_loads(Path(path_str).read_bytes())
 
 class MockSupabaseService:
     """Serviço mock para testes sem conexão real com Supabase"""
     
+    # Configurações mínimas exigidas de cada empresa
+    _REQUIRED = frozenset(('DB_URL', 'DB_TOKEN'))
+    
     def __init__(self):
         self.config_file = Path("test_configs/company_configs.json")
         self._load_configs()
@@ -57,14 +53,20 @@ class MockSupabaseService:
     def _load_configs(self):
         """Carrega configurações do arquivo JSON"""
         if self.config_file.exists():
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                self.configs = json.load(f)
+            mtime = self.config_file.stat().st_mtime
+            self.configs = _load_cached(str(self.config_file), mtime)
         else:
             self.configs = {}
+        # Visões somente leitura: podem ser compartilhadas entre tarefas sem cópia
+        self._frozen = {empresa_id: MappingProxyType(config) for empresa_id, config in self.configs.items()}
+    
+    def get_company_config_sync(self, empresa_id: str) -> Optional[Mapping[str, str]]:
+        """Obtém configuração de uma empresa (para quem não precisa de await)"""
+        return self._frozen.get(empresa_id)
     
-    async def get_company_config(self, empresa_id: str) -> Optional[Dict[str, str]]:
+    async def get_company_config(self, empresa_id: str) -> Optional[Mapping[str, str]]:
         """Obtém configuração de uma empresa"""
-        return self.configs.get(empresa_id)
+        return self._frozen.get(empresa_id)
     
     def validate_empresa_id(self, empresa_id: str) -> bool:
         """Valida se a empresa existe e tem configurações mínimas"""
@@ -73,16 +75,37 @@ class MockSupabaseService:
             return False
         
         # Verificar se tem configurações mínimas
-        required_keys = ['DB_URL', 'DB_TOKEN']
-        return all(key in config for key in required_keys)
+        return self._REQUIRED.issubset(config)
 
 # Instância global para uso nos testes
 mock_supabase = MockSupabaseService()
-'''
+'''.encode("utf-8")
+
+def setup_test_company_config():
+    """Configura dados de teste para a empresa test_company_001"""
+    
+    # Criar diretório de configurações de teste se não existir
+    test_config_dir = Path("test_configs")
+    test_config_dir.mkdir(exist_ok=True)
+    
+    test_company_config = TEST_COMPANY_CONFIG
+    
+    # Salvar configuração em arquivo JSON
+    config_file = test_config_dir / "company_configs.json"
+    config_file.write_bytes(orjson.dumps(test_company_config, option=orjson.OPT_INDENT_2))
+    
+    print(f"✅ Configuração de teste salva em: {config_file}")
+    print(f"📋 Empresa configurada: test_company_001")
+    print(f"🔗 DB_URL: {test_company_config['test_company_001']['DB_URL']}")
+    print(f"🔑 DB_TOKEN: {test_company_config['test_company_001']['DB_TOKEN'][:20]}...")
+    
+    return config_file
+
+def create_mock_supabase_service():
+    """Cria um serviço mock para testes"""
     
     mock_file = Path("test_configs/mock_supabase_service.py")
-    with open(mock_file, 'w', encoding='utf-8') as f:
-        f.write(mock_service_content)
+    mock_file.write_bytes(MOCK_SRC)
     
     print(f"✅ Serviço mock criado em: {mock_file}")
     return mock_file
@@ -41,17 +41,15 @@ SECRET_KEY=your_secret_key_here
         print("⚠️  IMPORTANTE: Configure as variáveis no arquivo .env antes de continuar!")
         return False
     
-    # Verifica se o diretório de logs existe
-    logs_dir = Path("logs")
-    if not logs_dir.exists():
-        logs_dir.mkdir(exist_ok=True)
-        print("✅ Diretório de logs criado!")
-    
-    # Verifica se o diretório de testes existe
-    tests_dir = Path("tests")
-    if not tests_dir.exists():
-        tests_dir.mkdir(exist_ok=True)
-        print("✅ Diretório de testes criado!")
+    # Cria os diretórios de logs e de testes (um único mkdir; EEXIST com diretório indica que já existe)
+    for directory, label in [("logs", "logs"), ("tests", "testes")]:
+        try:
+            Path(directory).mkdir(parents=True)
+            print(f"✅ Diretório de {label} criado!")
+        except FileExistsError:
+            # Só um diretório existente serve; um arquivo com o mesmo nome é erro
+            if not Path(directory).is_dir():
+                raise
     
     return True
 
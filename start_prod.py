@@ -4,10 +4,12 @@ Script para iniciar a aplicação em modo produção
 
 import os
 import sys
-import subprocess
 import signal
+from importlib.util import find_spec
 from pathlib import Path
 
+from dotenv import dotenv_values
+
 def setup_production_environment():
     """
     Configura o ambiente de produção
@@ -22,6 +24,11 @@ def setup_production_environment():
         print("O arquivo .env é obrigatório para produção!")
         return False
     
+    # Lê o .env uma única vez e exporta de uma vez só o que ainda não está no ambiente
+    env_values = dotenv_values(env_file)
+    os.environ.update({key: value for key, value in env_values.items()
+                       if value is not None and key not in os.environ})
+    
     # Verifica variáveis críticas
     required_vars = [
         "SUPABASE_URL",
@@ -29,10 +36,8 @@ def setup_production_environment():
         "SECRET_KEY"
     ]
     
-    missing_vars = []
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
+    environ = os.environ
+    missing_vars = [var for var in required_vars if not environ.get(var)]
     
     if missing_vars:
         print(f"❌ Variáveis obrigatórias não configuradas: {', '.join(missing_vars)}")
@@ -42,12 +47,15 @@ def setup_production_environment():
     os.environ["APP_ENV"] = "production"
     os.environ["LOG_LEVEL"] = "WARNING"
     
-    # Verifica diretórios necessários
+    # Cria diretórios necessários (um único mkdir; EEXIST com diretório indica que já existe)
     for directory in ["logs", "data", "backups"]:
-        dir_path = Path(directory)
-        if not dir_path.exists():
-            dir_path.mkdir(exist_ok=True)
+        try:
+            Path(directory).mkdir(parents=True)
             print(f"✅ Diretório {directory} criado!")
+        except FileExistsError:
+            # Só um diretório existente serve; um arquivo com o mesmo nome é erro
+            if not Path(directory).is_dir():
+                raise
     
     print("✅ Ambiente de produção configurado!")
     return True
@@ -55,6 +63,9 @@ def setup_production_environment():
 def check_dependencies():
     """
     Verifica se todas as dependências estão instaladas
+    
+    Usa find_spec para localizar os pacotes sem executar seus módulos; os imports
+    reais ficam para run_health_check, que precisa dos objetos em tempo de execução.
     """
     print("\n📦 VERIFICANDO DEPENDÊNCIAS")
     print("=" * 50)
@@ -70,12 +81,10 @@ def check_dependencies():
         ]
         
         for package in critical_packages:
-            try:
-                __import__(package)
-                print(f"✅ {package}")
-            except ImportError:
+            if find_spec(package) is None:
                 print(f"❌ {package} - NÃO INSTALADO")
                 return False
+            print(f"✅ {package}")
         
         print("✅ Todas as dependências estão instaladas!")
         return True
@@ -131,30 +140,21 @@ def start_production_server():
     print("=" * 50)
     
     try:
-        # Inicia o servidor uvicorn em modo produção
-        process = subprocess.Popen([
-            sys.executable, "-m", "uvicorn",
-            "main:app",
-            "--host", "0.0.0.0",
-            "--port", "8000", 
-            "--workers", "4",
-            "--access-log",
-            "--log-level", "warning"
-        ])
-        
-        # Aguarda o processo
-        process.wait()
+        import uvicorn
         
-    except KeyboardInterrupt:
-        print("\n\n🛑 Parando servidor...")
-        try:
-            process.terminate()
-            process.wait(timeout=10)
-        except:
-            process.kill()
+        # Inicia o servidor uvicorn no próprio processo; os padrões loop="auto" e
+        # http="auto" já usam uvloop e httptools (ambos em C) quando instalados
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=4,
+            access_log=True,
+            log_level="warning"
+        )
         print("✅ Servidor parado!")
         
-    except FileNotFoundError:
+    except ImportError:
         print("❌ uvicorn não encontrado. Instale com: pip install uvicorn")
         return False
         
@@ -3,12 +3,28 @@ Serviço mock do Supabase para testes
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+@lru_cache(maxsize=8)
+def _load_cached(path_str: str, mtime: float) -> dict:
+    """Lê e interpreta o JSON de configurações (mtime na chave invalida o cache quando o arquivo muda)"""
+    return _json_loads(Path(path_str).read_bytes())
 
 class MockSupabaseService:
     """Serviço mock para testes sem conexão real com Supabase"""
     
+    # Configurações mínimas exigidas de cada empresa
+    _REQUIRED = frozenset(('DB_URL', 'DB_TOKEN'))
+    
     def __init__(self):
         self.config_file = Path("test_configs/company_configs.json")
         self._load_configs()
@@ -16,14 +32,20 @@ class MockSupabaseService:
     def _load_configs(self):
         """Carrega configurações do arquivo JSON"""
         if self.config_file.exists():
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                self.configs = json.load(f)
+            mtime = self.config_file.stat().st_mtime
+            self.configs = _load_cached(str(self.config_file), mtime)
         else:
             self.configs = {}
+        # Visões somente leitura: podem ser compartilhadas entre tarefas sem cópia
+        self._frozen = {empresa_id: MappingProxyType(config) for empresa_id, config in self.configs.items()}
+    
+    def get_company_config_sync(self, empresa_id: str) -> Optional[Mapping[str, str]]:
+        """Obtém configuração de uma empresa (para quem não precisa de await)"""
+        return self._frozen.get(empresa_id)
     
-    async def get_company_config(self, empresa_id: str) -> Optional[Dict[str, str]]:
+    async def get_company_config(self, empresa_id: str) -> Optional[Mapping[str, str]]:
         """Obtém configuração de uma empresa"""
-        return self.configs.get(empresa_id)
+        return self._frozen.get(empresa_id)
     
     def validate_empresa_id(self, empresa_id: str) -> bool:
         """Valida se a empresa existe e tem configurações mínimas"""
@@ -32,8 +54,7 @@ class MockSupabaseService:
             return False
         
         # Verificar se tem configurações mínimas
-        required_keys = ['DB_URL', 'DB_TOKEN']
-        return all(key in config for key in required_keys)
+        return self._REQUIRED.issubset(config)
 
 # Instância global para uso nos testes
 mock_supabase = MockSupabaseService()
@@ -1,5 +1,8 @@
-import requests
-import json
+import asyncio
+
+import orjson
+
+from tests._client import BASE_URL, post_one
 
 # Testar a correção com dados de produtos estruturados corretamente
 test_data = {
@@ -18,13 +21,15 @@ test_data = {
     ]
 }
 
+# Serializado uma única vez no import
+PAYLOAD = orjson.dumps(test_data)
+
 try:
     # Testar na porta 8000 (onde o servidor já está rodando)
-    response = requests.post(
-        "http://localhost:8000/api/data/3e1a0646-0b39-4ea4-9f49-bf7c0cf34ac2",
-        json=test_data,
-        headers={"Content-Type": "application/json"}
-    )
+    response = asyncio.run(post_one(
+        f"{BASE_URL}/api/data/3e1a0646-0b39-4ea4-9f49-bf7c0cf34ac2",
+        PAYLOAD
+    ))
     
     print(f"Status: {response.status_code}")
     print(f"Resposta: {response.text}")
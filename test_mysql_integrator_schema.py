@@ -3,75 +3,85 @@
 Teste para o novo formato MySQL Integrator Schema
 """
 
-import requests
+import asyncio
 import json
 from datetime import datetime
 
-def test_mysql_integrator_schema():
+import httpx
+import orjson
+
+from tests._client import BASE_URL, LIMITS, post_case
+
+# URL do endpoint
+URL = f"{BASE_URL}/webhook/schema/3e1a0646-0b39-4ea4-9f49-bf7c0cf34ac2"
+
+# Dados no formato que seu sistema envia
+INTEGRATOR_PAYLOAD = {
+    "schema": {
+        "database_name": "automatiza",
+        "tables": [
+            {
+                "name": "cadastro_produtos",
+                "columns": [
+                    {
+                        "name": "id",
+                        "type": "int",
+                        "nullable": False,
+                        "is_primary_key": True,
+                        "max_length": None
+                    },
+                    {
+                        "name": "nome",
+                        "type": "varchar",
+                        "nullable": False,
+                        "is_primary_key": False,
+                        "max_length": 255
+                    },
+                    {
+                        "name": "preco",
+                        "type": "decimal",
+                        "nullable": True,
+                        "is_primary_key": False,
+                        "max_length": None
+                    },
+                    {
+                        "name": "data_criacao",
+                        "type": "datetime", 
+                        "nullable": True,
+                        "is_primary_key": False,
+                        "max_length": None
+                    }
+                ],
+                "record_count": 0
+            }
+        ]
+    },
+    "timestamp": datetime.now().isoformat(),
+    "source": "mysql_integrator_webhook",
+    "empresa_id": "3e1a0646-0b39-4ea4-9f49-bf7c0cf34ac2"
+}
+
+# Dados no formato tradicional
+TRADITIONAL_PAYLOAD = {
+    "schema": "CREATE TABLE teste_tradicional (id INTEGER PRIMARY KEY, nome VARCHAR(100) NOT NULL);",
+    "table_name": "teste_tradicional",
+    "schema_type": "mysql"
+}
+
+# Corpos serializados uma única vez por processo
+INTEGRATOR_BODY = orjson.dumps(INTEGRATOR_PAYLOAD)
+TRADITIONAL_BODY = orjson.dumps(TRADITIONAL_PAYLOAD)
+
+async def check_mysql_integrator_schema(client: httpx.AsyncClient):
     """Testa o envio de schema no formato do MySQL Integrator"""
     
-    # URL do endpoint
-    url = "http://localhost:8000/webhook/schema/3e1a0646-0b39-4ea4-9f49-bf7c0cf34ac2"
-    
-    # Dados no formato que seu sistema envia
-    payload = {
-        "schema": {
-            "database_name": "automatiza",
-            "tables": [
-                {
-                    "name": "cadastro_produtos",
-                    "columns": [
-                        {
-                            "name": "id",
-                            "type": "int",
-                            "nullable": False,
-                            "is_primary_key": True,
-                            "max_length": None
-                        },
-                        {
-                            "name": "nome",
-                            "type": "varchar",
-                            "nullable": False,
-                            "is_primary_key": False,
-                            "max_length": 255
-                        },
-                        {
-                            "name": "preco",
-                            "type": "decimal",
-                            "nullable": True,
-                            "is_primary_key": False,
-                            "max_length": None
-                        },
-                        {
-                            "name": "data_criacao",
-                            "type": "datetime", 
-                            "nullable": True,
-                            "is_primary_key": False,
-                            "max_length": None
-                        }
-                    ],
-                    "record_count": 0
-                }
-            ]
-        },
-        "timestamp": datetime.now().isoformat(),
-        "source": "mysql_integrator_webhook",
-        "empresa_id": "3e1a0646-0b39-4ea4-9f49-bf7c0cf34ac2"
-    }
-    
-    # Headers
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
-    
     try:
         print("🧪 Testando novo formato MySQL Integrator Schema...")
-        print(f"📡 Endpoint: {url}")
-        print(f"📦 Payload: {json.dumps(payload, indent=2, ensure_ascii=False)}")
+        print(f"📡 Endpoint: {URL}")
+        print(f"📦 Payload: {json.dumps(INTEGRATOR_PAYLOAD, indent=2, ensure_ascii=False)}")
         
         # Fazer a requisição
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        response = await post_case(client, URL, INTEGRATOR_BODY)
         
         print(f"\n📊 Status Code: {response.status_code}")
         print(f"📋 Response: {json.dumps(response.json(), indent=2, ensure_ascii=False)}")
@@ -83,35 +93,20 @@ def test_mysql_integrator_schema():
             print(f"\n❌ Erro: {response.status_code}")
             return False
             
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("\n❌ Erro: Não foi possível conectar ao servidor. Certifique-se de que ele está rodando.")
         return False
     except Exception as e:
         print(f"\n❌ Erro inesperado: {str(e)}")
         return False
 
-def test_formato_tradicional():
+async def check_formato_tradicional(client: httpx.AsyncClient):
     """Testa o formato tradicional para garantir retrocompatibilidade"""
     
-    # URL do endpoint
-    url = "http://localhost:8000/webhook/schema/3e1a0646-0b39-4ea4-9f49-bf7c0cf34ac2"
-    
-    # Dados no formato tradicional
-    payload = {
-        "schema": "CREATE TABLE teste_tradicional (id INTEGER PRIMARY KEY, nome VARCHAR(100) NOT NULL);",
-        "table_name": "teste_tradicional",
-        "schema_type": "mysql"
-    }
-    
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
-    
     try:
         print("\n🧪 Testando formato tradicional (retrocompatibilidade)...")
         
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        response = await post_case(client, URL, TRADITIONAL_BODY)
         
         print(f"📊 Status Code: {response.status_code}")
         print(f"📋 Response: {json.dumps(response.json(), indent=2, ensure_ascii=False)}")
@@ -127,17 +122,24 @@ def test_formato_tradicional():
         print(f"\n❌ Erro: {str(e)}")
         return False
 
+async def run_tests():
+    """Executa os dois formatos em sequência com um único cliente HTTP"""
+    async with httpx.AsyncClient(limits=LIMITS, timeout=30) as client:
+        # Testar novo formato
+        sucesso_novo = await check_mysql_integrator_schema(client)
+        
+        print("\n" + "=" * 60)
+        
+        # Testar formato tradicional
+        sucesso_tradicional = await check_formato_tradicional(client)
+        
+        return sucesso_novo, sucesso_tradicional
+
 if __name__ == "__main__":
     print("🚀 Iniciando testes do endpoint /webhook/schema/")
     print("=" * 60)
     
-    # Testar novo formato
-    sucesso_novo = test_mysql_integrator_schema()
-    
-    print("\n" + "=" * 60)
-    
-    # Testar formato tradicional
-    sucesso_tradicional = test_formato_tradicional()
+    sucesso_novo, sucesso_tradicional = asyncio.run(run_tests())
     
     print("\n" + "=" * 60)
     print("📊 Resumo dos Testes:")
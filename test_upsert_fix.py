@@ -1,30 +1,35 @@
 import asyncio
-import requests
-import json
+
+import httpx
+import orjson
+
+from tests._client import BASE_URL, LIMITS, post_case
+
+# Dados para teste (serializados uma única vez no import)
+test_data = {
+    "table_name": "usuarios",
+    "data": [
+        {
+            "id": 1,
+            "nome": "João Silva Teste",
+            "email": "joao@teste.com",
+            "idade": 30
+        }
+    ]
+}
+PAYLOAD = orjson.dumps(test_data)
 
 async def test_upsert_fix():
     """Testar se o upsert agora funciona corretamente"""
     
-    # Dados para teste
-    test_data = {
-        "table_name": "usuarios",
-        "data": [
-            {
-                "id": 1,
-                "nome": "João Silva Teste",
-                "email": "joao@teste.com",
-                "idade": 30
-            }
-        ]
-    }
-    
     try:
         # Fazer requisição POST para o endpoint /api/data
-        response = requests.post(
-            "http://localhost:8000/api/data/3e1a0646-0b39-4ea4-9f49-bf7c0cf34ac2",
-            json=test_data,
-            headers={"Content-Type": "application/json"}
-        )
+        async with httpx.AsyncClient(limits=LIMITS, timeout=30) as client:
+            response = await post_case(
+                client,
+                f"{BASE_URL}/api/data/3e1a0646-0b39-4ea4-9f49-bf7c0cf34ac2",
+                PAYLOAD
+            )
         
         print(f"Status: {response.status_code}")
         print(f"Resposta: {response.text}")
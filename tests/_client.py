@@ -0,0 +1,146 @@
+"""
+Cliente HTTP compartilhado pelos scripts de teste da API
+"""
+
+import http.client
+import socket
+from typing import Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+BASE_URL = "http://localhost:8000"
+
+# Um único pool de conexões para todas as requisições de uma execução
+LIMITS = httpx.Limits(max_connections=50)
+
+JSON_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
+# Sessão síncrona compartilhada: conexões keep-alive reaproveitadas entre os testes
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50,
+                       max_retries=Retry(total=2, backoff_factor=0.1))
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+_LOOPBACK_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+
+
+class FastClient:
+    """Cliente HTTP/1.1 mínimo sobre http.client para a API em loopback"""
+
+    def __init__(self, host: str, port: int):
+        """
+        Inicializa o cliente com uma conexão persistente
+
+        Args:
+            host: Host da API
+            port: Porta da API
+        """
+        self._conn = http.client.HTTPConnection(host, port, timeout=30)
+
+    def _connect(self) -> None:
+        self._conn.connect()
+        self._conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def request(self, method: str, path: str, body: Optional[bytes] = None) -> Tuple[int, bytes]:
+        """
+        Envia uma requisição pela conexão persistente
+
+        Args:
+            method: Método HTTP
+            path: Caminho do endpoint
+            body: Corpo JSON já serializado
+
+        Returns:
+            Tupla (status, corpo da resposta)
+        """
+        for attempt in range(2):
+            if self._conn.sock is None:
+                self._connect()
+            try:
+                self._conn.request(method, path, body=body, headers=JSON_HEADERS)
+                response = self._conn.getresponse()
+                return response.status, response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # O servidor fechou a conexão keep-alive ociosa: reabre e repete uma vez.
+                # Só GET é repetido: um POST pode ter sido processado antes da queda
+                self._conn.close()
+                if attempt or method != "GET":
+                    raise
+
+    def get(self, path: str) -> Tuple[int, bytes]:
+        return self.request("GET", path)
+
+    def post(self, path: str, body: bytes) -> Tuple[int, bytes]:
+        return self.request("POST", path, body)
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class SessionClient:
+    """Mesma interface do FastClient sobre a SESSION (hosts remotos, TLS)"""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/")
+
+    def get(self, path: str) -> Tuple[int, bytes]:
+        response = SESSION.get(self.base_url + path)
+        return response.status_code, response.content
+
+    def post(self, path: str, body: bytes) -> Tuple[int, bytes]:
+        response = SESSION.post(self.base_url + path, data=body, headers=JSON_HEADERS)
+        return response.status_code, response.content
+
+    def close(self) -> None:
+        pass
+
+
+def sync_client(base_url: str = BASE_URL):
+    """
+    Escolhe o cliente síncrono para a URL base
+
+    Args:
+        base_url: URL base da API
+
+    Returns:
+        FastClient para http em loopback; SessionClient (requests) para os demais
+    """
+    parts = urlsplit(base_url)
+    if parts.scheme == "http" and parts.hostname in _LOOPBACK_HOSTS:
+        return FastClient(parts.hostname, parts.port or 80)
+    return SessionClient(base_url)
+
+
+async def post_case(client: httpx.AsyncClient, url: str, payload: bytes) -> httpx.Response:
+    """
+    Envia um caso de teste (POST com corpo JSON)
+
+    Args:
+        client: Cliente HTTP assíncrono compartilhado
+        url: URL do endpoint
+        payload: Corpo da requisição já serializado (orjson.dumps no import do script)
+
+    Returns:
+        Resposta HTTP
+    """
+    return await client.post(url, content=payload, headers=JSON_HEADERS)
+
+
+async def post_one(url: str, payload: bytes) -> httpx.Response:
+    """
+    Envia um único caso de teste com um cliente próprio
+
+    Args:
+        url: URL do endpoint
+        payload: Corpo da requisição já serializado
+
+    Returns:
+        Resposta HTTP
+    """
+    async with httpx.AsyncClient(limits=LIMITS, timeout=30) as client:
+        return await post_case(client, url, payload)
@@ -0,0 +1,90 @@
+"""
+Corpos das requisições dos casos de teste, serializados uma única vez no import
+"""
+
+import json
+from typing import Any, Final
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+EMPRESA: Final = "3e1a0646-0b39-4ea4-9f49-bf7c0cf34ac2"
+
+# Tabela nova
+NEW_TABLE: Final[bytes] = _dumps({
+    "table_name": "usuarios",  # Usando tabela que existe
+    "data": [
+        {
+            "nome": "João Silva",
+            "email": "joao.silva@teste.com",
+            "idade": 30,
+            "ativo": True
+        },
+        {
+            "nome": "Maria Santos", 
+            "email": "maria.santos@teste.com",
+            "idade": 25,
+            "ativo": False
+        }
+    ]
+})
+
+# Tabela existente
+EXISTING_TABLE: Final[bytes] = _dumps({
+    "table_name": "usuarios",  # Usando tabela que existe
+    "data": [
+        {
+            "nome": "Pedro Costa",
+            "email": "pedro.costa@teste.com",
+            "idade": 35,
+            "ativo": True
+        }
+    ]
+})
+
+# Tabela de produtos com colunas novas
+NEW_COLUMNS: Final[bytes] = _dumps({
+    "table_name": "produtos_teste",
+    "data": [
+        {
+            "id": 1,
+            "nome": "Produto com Nova Coluna",
+            "preco": 199.99,
+            "ativo": True,
+            "criado_em": "2024-01-04T16:00:00",
+            "categoria": "Eletrônicos",  # Nova coluna
+            "peso": 1.5,  # Nova coluna
+            "tags": ["novo", "popular"]  # Nova coluna JSON
+        }
+    ]
+})
+
+# Webhook de schema
+WEBHOOK_SCHEMA: Final[bytes] = _dumps({
+    "schema": "CREATE TABLE webhook_test_table (id INTEGER PRIMARY KEY, title TEXT, status BOOLEAN);",
+    "table_name": "webhook_test_table",
+    "empresa_id": EMPRESA,
+    "schema_type": "postgresql"
+})
+
+# Empresa inexistente
+UNKNOWN_COMPANY: Final[bytes] = _dumps({
+    "table_name": "test_table",
+    "data": [{"id": 1, "name": "test"}]
+})
+
+# Nome de tabela inválido e dados vazios
+INVALID_CONFIG: Final[bytes] = _dumps({
+    "table_name": "123invalid",  # Nome inválido
+    "data": []  # Dados vazios
+})
+
+# "data" como string em vez de lista
+INVALID_FORMAT: Final[bytes] = _dumps({
+    "table_name": "test_table",
+    "data": "invalid_data_format"  # Deveria ser uma lista, não string
+})
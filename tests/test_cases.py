@@ -2,10 +2,87 @@
 Casos de teste para a API de recepção de dados
 """
 
-import requests
+import asyncio
+import atexit
 import json
+import sys
 import time
-from typing import Dict, Any
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+import httpx
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# uvloop (requirements.txt, exceto Windows) reduz o custo do event loop por requisição
+try:
+    import uvloop
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
+# Adicionar o diretório raiz ao path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from tests import _payloads
+from tests._client import JSON_HEADERS
+from tests._payloads import EMPRESA
+
+URL_DATA = f"/api/data/{EMPRESA}"
+URL_SCHEMA = f"/webhook/schema/{EMPRESA}"
+URL_UNKNOWN_COMPANY = "/api/data/empresa_inexistente_999"
+URL_ROOT = "/"
+URL_HEALTH = "/health"
+URL_COMPANIES = "/api/companies"
+
+# Event loop único do processo: chamadas repetidas de main() reaproveitam o loop
+# e, com ele, as conexões do cliente compartilhado (fechado antes do loop no atexit)
+_LOOP = _new_event_loop()
+atexit.register(_LOOP.close)
+
+# Cliente compartilhado entre instâncias de TestCases e execuções de main()
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+_CLIENT: Optional[httpx.AsyncClient] = None
+_CLIENT_KEY: Optional[Tuple[asyncio.AbstractEventLoop, str]] = None
+
+
+def _get_client(base_url: str) -> httpx.AsyncClient:
+    """
+    Retorna o cliente HTTP compartilhado, criando-o na primeira chamada
+
+    As conexões ficam presas ao event loop que as abriu, por isso o cliente
+    é recriado se o loop (ou a URL base) mudar.
+
+    Args:
+        base_url: URL base da API
+
+    Returns:
+        Cliente assíncrono com conexões keep-alive reaproveitadas
+    """
+    global _CLIENT, _CLIENT_KEY
+    key = (asyncio.get_running_loop(), base_url)
+    if _CLIENT is None or _CLIENT.is_closed or _CLIENT_KEY != key:
+        _CLIENT = httpx.AsyncClient(
+            base_url=base_url,
+            limits=_LIMITS,
+            timeout=30.0
+        )
+        _CLIENT_KEY = key
+    return _CLIENT
+
+
+@atexit.register
+def _close_client() -> None:
+    """Fecha o pool do cliente compartilhado no encerramento do processo"""
+    if _CLIENT is None or _CLIENT.is_closed:
+        return
+    loop = _CLIENT_KEY[0]
+    if not loop.is_closed():
+        loop.run_until_complete(_CLIENT.aclose())
 
 class TestCases:
     """Classe para executar casos de teste da API"""
@@ -18,9 +95,22 @@ class TestCases:
             base_url: URL base da API
         """
         self.base_url = base_url
-        self.session = requests.Session()
     
-    def test_health_check(self) -> bool:
+    async def _post(self, client: httpx.AsyncClient, path: str, body: bytes) -> httpx.Response:
+        """
+        POST de um corpo já serializado
+        
+        Args:
+            client: Cliente HTTP compartilhado
+            path: Caminho do endpoint
+            body: Corpo JSON em bytes
+            
+        Returns:
+            Resposta HTTP
+        """
+        return await client.post(path, content=body, headers=JSON_HEADERS)
+    
+    async def test_health_check(self, client: httpx.AsyncClient) -> bool:
         """
         ✅ Teste básico de saúde da API
         
@@ -28,11 +118,11 @@ class TestCases:
             True se passou no teste
         """
         try:
-            response = self.session.get(f"{self.base_url}/health")
+            response = await client.get(URL_HEALTH)
             if response.status_code != 200:
                 print(f"❌ Health check - FALHOU: Status {response.status_code}")
                 return False
-            data = response.json()
+            data = _loads(response.content)
             # Aceita "healthy" ou "degraded" como status válidos
             if data.get("status") not in ["healthy", "degraded"]:
                 print(f"❌ Health check - FALHOU: Status inválido {data}")
@@ -43,7 +133,7 @@ class TestCases:
             print(f"❌ Health check - FALHOU: {e}")
             return False
     
-    def test_new_table_data_reception(self) -> bool:
+    async def test_new_table_data_reception(self, client: httpx.AsyncClient) -> bool:
         """
         ✅ Recepção de dados com tabela nova
         
@@ -51,34 +141,13 @@ class TestCases:
             True se passou no teste
         """
         try:
-            test_data = {
-                "table_name": "usuarios",  # Usando tabela que existe
-                "data": [
-                    {
-                        "nome": "João Silva",
-                        "email": "joao.silva@teste.com",
-                        "idade": 30,
-                        "ativo": True
-                    },
-                    {
-                        "nome": "Maria Santos", 
-                        "email": "maria.santos@teste.com",
-                        "idade": 25,
-                        "ativo": False
-                    }
-                ]
-            }
-            
-            response = self.session.post(
-                f"{self.base_url}/api/data/3e1a0646-0b39-4ea4-9f49-bf7c0cf34ac2",
-                json=test_data
-            )
+            response = await self._post(client, URL_DATA, _payloads.NEW_TABLE)
             
             # Aceita tanto 200 quanto 201 para criação
             if response.status_code not in [200, 201]:
                 print(f"❌ Recepção com tabela nova - FALHOU: Status {response.status_code}")
                 return False
-            data = response.json()
+            data = _loads(response.content)
             if not data.get("success"):
                 print(f"❌ Recepção com tabela nova - FALHOU: {data}")
                 return False
@@ -89,7 +158,7 @@ class TestCases:
             print(f"❌ Recepção com tabela nova - FALHOU: {e}")
             return False
     
-    def test_existing_table_data_reception(self) -> bool:
+    async def test_existing_table_data_reception(self, client: httpx.AsyncClient) -> bool:
         """
         ✅ Recepção de dados com tabela existente
         
@@ -97,27 +166,12 @@ class TestCases:
             True se passou no teste
         """
         try:
-            test_data = {
-                "table_name": "usuarios",  # Usando tabela que existe
-                "data": [
-                    {
-                        "nome": "Pedro Costa",
-                        "email": "pedro.costa@teste.com",
-                        "idade": 35,
-                        "ativo": True
-                    }
-                ]
-            }
-            
-            response = self.session.post(
-                f"{self.base_url}/api/data/3e1a0646-0b39-4ea4-9f49-bf7c0cf34ac2",
-                json=test_data
-            )
+            response = await self._post(client, URL_DATA, _payloads.EXISTING_TABLE)
             
             if response.status_code != 200:
                 print(f"❌ Recepção com tabela existente - FALHOU: Status {response.status_code}")
                 return False
-            data = response.json()
+            data = _loads(response.content)
             if not data.get("success"):
                 print(f"❌ Recepção com tabela existente - FALHOU: {data}")
                 return False
@@ -128,7 +182,7 @@ class TestCases:
             print(f"❌ Recepção com tabela existente - FALHOU: {e}")
             return False
     
-    def test_new_columns_addition(self) -> bool:
+    async def test_new_columns_addition(self, client: httpx.AsyncClient) -> bool:
         """
         ✅ Adição de novas colunas
         
@@ -136,32 +190,12 @@ class TestCases:
             True se passou no teste
         """
         try:
-            # Criar uma tabela de produtos para testar adição de colunas
-            test_data = {
-                "table_name": "produtos_teste",
-                "data": [
-                    {
-                        "id": 1,
-                        "nome": "Produto com Nova Coluna",
-                        "preco": 199.99,
-                        "ativo": True,
-                        "criado_em": "2024-01-04T16:00:00",
-                        "categoria": "Eletrônicos",  # Nova coluna
-                        "peso": 1.5,  # Nova coluna
-                        "tags": ["novo", "popular"]  # Nova coluna JSON
-                    }
-                ]
-            }
-            
-            response = self.session.post(
-                f"{self.base_url}/api/data/3e1a0646-0b39-4ea4-9f49-bf7c0cf34ac2",
-                json=test_data
-            )
+            response = await self._post(client, URL_DATA, _payloads.NEW_COLUMNS)
             
             if response.status_code != 200:
                 print(f"❌ Adição de novas colunas - FALHOU: Status {response.status_code}")
                 return False
-            data = response.json()
+            data = _loads(response.content)
             if not data.get("success"):
                 print(f"❌ Adição de novas colunas - FALHOU: {data}")
                 return False
@@ -172,7 +206,7 @@ class TestCases:
             print(f"❌ Adição de novas colunas - FALHOU: {e}")
             return False
     
-    def test_webhook_schema(self) -> bool:
+    async def test_webhook_schema(self, client: httpx.AsyncClient) -> bool:
         """
         ✅ Webhook de schema
         
@@ -180,22 +214,12 @@ class TestCases:
             True se passou no teste
         """
         try:
-            schema_data = {
-                "schema": "CREATE TABLE webhook_test_table (id INTEGER PRIMARY KEY, title TEXT, status BOOLEAN);",
-                "table_name": "webhook_test_table",
-                "empresa_id": "3e1a0646-0b39-4ea4-9f49-bf7c0cf34ac2",
-                "schema_type": "postgresql"
-            }
-            
-            response = self.session.post(
-                f"{self.base_url}/webhook/schema/3e1a0646-0b39-4ea4-9f49-bf7c0cf34ac2",
-                json=schema_data
-            )
+            response = await self._post(client, URL_SCHEMA, _payloads.WEBHOOK_SCHEMA)
             
             if response.status_code != 200:
                 print(f"❌ Webhook de schema - FALHOU: Status {response.status_code}")
                 return False
-            data = response.json()
+            data = _loads(response.content)
             if not data.get("success"):
                 print(f"❌ Webhook de schema - FALHOU: {data}")
                 return False
@@ -206,7 +230,7 @@ class TestCases:
             print(f"❌ Webhook de schema - FALHOU: {e}")
             return False
     
-    def test_company_not_found(self) -> bool:
+    async def test_company_not_found(self, client: httpx.AsyncClient) -> bool:
         """
         ❌ Empresa não encontrada
         
@@ -214,21 +238,13 @@ class TestCases:
             True se passou no teste (erro esperado)
         """
         try:
-            test_data = {
-                "table_name": "test_table",
-                "data": [{"id": 1, "name": "test"}]
-            }
-            
-            response = self.session.post(
-                f"{self.base_url}/api/data/empresa_inexistente_999",
-                json=test_data
-            )
+            response = await self._post(client, URL_UNKNOWN_COMPANY, _payloads.UNKNOWN_COMPANY)
             
             # Espera erro 404
             if response.status_code != 404:
                 print(f"❌ Empresa não encontrada - FALHOU: Esperado 404, recebido {response.status_code}")
                 return False
-            data = response.json()
+            data = _loads(response.content)
             if "não encontrada" not in data.get("detail", "").lower():
                 print(f"❌ Empresa não encontrada - FALHOU: Mensagem incorreta {data}")
                 return False
@@ -239,7 +255,7 @@ class TestCases:
             print(f"❌ Empresa não encontrada - FALHOU: {e}")
             return False
     
-    def test_invalid_config(self) -> bool:
+    async def test_invalid_config(self, client: httpx.AsyncClient) -> bool:
         """
         ❌ Configurações inválidas
         
@@ -247,16 +263,7 @@ class TestCases:
             True se passou no teste (erro esperado)
         """
         try:
-            # Testa com dados inválidos
-            invalid_data = {
-                "table_name": "123invalid",  # Nome inválido
-                "data": []  # Dados vazios
-            }
-            
-            response = self.session.post(
-                f"{self.base_url}/api/data/3e1a0646-0b39-4ea4-9f49-bf7c0cf34ac2",
-                json=invalid_data
-            )
+            response = await self._post(client, URL_DATA, _payloads.INVALID_CONFIG)
             
             # Espera erro 400
             if response.status_code != 400:
@@ -269,7 +276,7 @@ class TestCases:
             print(f"❌ Configurações inválidas - FALHOU: {e}")
             return False
     
-    def test_connection_failure(self) -> bool:
+    async def test_connection_failure(self, client: httpx.AsyncClient) -> bool:
         """
         ❌ Falha na conexão
         
@@ -277,16 +284,7 @@ class TestCases:
             True se passou no teste (erro esperado)
         """
         try:
-            # Testa com dados que causam erro de validação (formato inválido)
-            test_data = {
-                "table_name": "test_table",
-                "data": "invalid_data_format"  # Deveria ser uma lista, não string
-            }
-            
-            response = self.session.post(
-                f"{self.base_url}/api/data/3e1a0646-0b39-4ea4-9f49-bf7c0cf34ac2",
-                json=test_data
-            )
+            response = await self._post(client, URL_DATA, _payloads.INVALID_FORMAT)
             
             # Espera erro 400 ou 422 para dados inválidos (validação do FastAPI)
             if response.status_code not in [400, 422]:
@@ -299,18 +297,26 @@ class TestCases:
             print(f"❌ Falha na conexão - FALHOU: {e}")
             return False
     
-    def test_rate_limiting(self) -> bool:
+    async def test_rate_limiting(self, client: httpx.AsyncClient) -> bool:
         """
         Teste de rate limiting
         
         Returns:
             True se passou no teste
         """
+        # Limita as requisições em voo para não esgotar os descritores locais
+        semaphore = asyncio.Semaphore(32)
+        
+        async def fetch() -> int:
+            async with semaphore:
+                response = await client.get(URL_COMPANIES)
+                return response.status_code
+        
+        # Dispara uma rajada que excede o limite de 100 dentro da mesma janela
+        tasks = [asyncio.ensure_future(fetch()) for _ in range(150)]
         try:
-            # Faz muitas requisições rapidamente
-            for i in range(105):  # Excede o limite de 100
-                response = self.session.get(f"{self.base_url}/api/companies")
-                if response.status_code == 429:
+            for future in asyncio.as_completed(tasks):
+                if await future == 429:
                     print("✅ Rate limiting - PASSOU (limite atingido)")
                     return True
             
@@ -320,8 +326,30 @@ class TestCases:
         except Exception as e:
             print(f"❌ Rate limiting - FALHOU: {e}")
             return False
+        finally:
+            # Cancela as requisições restantes assim que o resultado é conhecido
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
     
-    def run_all_tests(self) -> Dict[str, bool]:
+    async def _warm_up(self, client: httpx.AsyncClient, connections: int) -> None:
+        """
+        Abre as conexões keep-alive do pool antes dos testes
+        
+        Usa o endpoint raiz, que responde sem consultar bancos (o /health mede
+        CPU por 1 s e consulta o Supabase principal).
+        
+        Args:
+            client: Cliente HTTP compartilhado
+            connections: Número de conexões a abrir (requisições simultâneas dos testes)
+        """
+        # Falhas aqui são ignoradas: os próprios testes reportam a API fora do ar
+        await asyncio.gather(
+            *(client.get(URL_ROOT) for _ in range(connections)),
+            return_exceptions=True
+        )
+    
+    async def run_all_tests(self) -> Dict[str, bool]:
         """
         Executa todos os casos de teste
         
@@ -331,17 +359,37 @@ class TestCases:
         print("🧪 EXECUTANDO CASOS DE TESTE")
         print("=" * 50)
         
-        results = {
-            "health_check": self.test_health_check(),
-            "new_table_reception": self.test_new_table_data_reception(),
-            "existing_table_reception": self.test_existing_table_data_reception(),
-            "new_columns_addition": self.test_new_columns_addition(),
-            "webhook_schema": self.test_webhook_schema(),
-            "company_not_found": self.test_company_not_found(),
-            "invalid_config": self.test_invalid_config(),
-            "connection_failure": self.test_connection_failure(),
-            "rate_limiting": self.test_rate_limiting()
+        client = _get_client(self.base_url)
+        
+        # Testes que criam/alteram tabelas dependem uns dos outros: rodam em sequência
+        sequential = {
+            "new_table_reception": self.test_new_table_data_reception,
+            "existing_table_reception": self.test_existing_table_data_reception,
+            "new_columns_addition": self.test_new_columns_addition
         }
+        # Os independentes rodam em paralelo com a sequência, sobre o mesmo pool de conexões
+        independent = {
+            "health_check": self.test_health_check,
+            "webhook_schema": self.test_webhook_schema,
+            "company_not_found": self.test_company_not_found,
+            "invalid_config": self.test_invalid_config,
+            "connection_failure": self.test_connection_failure
+        }
+        
+        async def run_sequential() -> List[bool]:
+            return [await test(client) for test in sequential.values()]
+        
+        # Uma conexão para a sequência e uma para cada teste independente
+        await self._warm_up(client, 1 + len(independent))
+        
+        sequential_outcomes, *independent_outcomes = await asyncio.gather(
+            run_sequential(), *(test(client) for test in independent.values())
+        )
+        results = dict(zip(independent, independent_outcomes))
+        results.update(zip(sequential, sequential_outcomes))
+        
+        # Rate limiting depende da contagem de requisições: roda por último, sozinho
+        results["rate_limiting"] = await self.test_rate_limiting(client)
         
         print("\n" + "=" * 50)
         print("📊 RESUMO DOS TESTES")
@@ -362,7 +410,7 @@ class TestCases:
 def main():
     """Função principal para executar os testes"""
     tester = TestCases()
-    results = tester.run_all_tests()
+    results = _LOOP.run_until_complete(tester.run_all_tests())
     
     # Retorna código de saída baseado nos resultados
     if all(results.values()):